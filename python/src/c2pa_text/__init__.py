@@ -11,9 +11,10 @@ Validation:
 """
 
 import re
-import struct
 import unicodedata
-from typing import Optional, Tuple
+from typing import Final, Optional, Tuple
+
+from ._constants import _HEADER_SIZE, _HEADER_STRUCT, MAGIC, VERSION
 
 # Import validation utilities
 from .validator import (
@@ -27,12 +28,7 @@ from .validator import (
 
 # ---------------------- Constants -------------------------------------------
 
-MAGIC = b"C2PATXT\0"  # 8-byte magic sequence (0x4332504154585400)
-VERSION = 1  # Current wrapper version
-_HEADER_STRUCT = struct.Struct("!8sBI")  # Big-endian: Magic(8), Version(1), Length(4)
-_HEADER_SIZE = _HEADER_STRUCT.size
-
-ZWNBSP = "\ufeff"  # Zero-Width No-Break Space (Prefix)
+ZWNBSP: Final[str] = "\ufeff"  # Zero-Width No-Break Space (Prefix)
 _VS_CHAR_CLASS = "[\ufe00-\ufe0f\U000e0100-\U000e01ef]"
 _WRAPPER_RE = re.compile(ZWNBSP + f"({_VS_CHAR_CLASS}{{{_HEADER_SIZE},}})")
 
@@ -55,16 +51,29 @@ def _vs_to_byte(codepoint: int) -> Optional[int]:
     return None
 
 
-def _byte_offset_to_char_index(value: str, byte_offset: int) -> int:
-    if byte_offset <= 0:
-        return 0
-    consumed = 0
-    for idx, ch in enumerate(value):
-        ch_len = len(ch.encode("utf-8"))
-        if consumed + ch_len > byte_offset:
-            return idx
-        consumed += ch_len
-    return len(value)
+def _nfc(text: str) -> str:
+    """Return *text* in NFC, skipping normalization when it is already NFC."""
+    if text.isascii() or unicodedata.is_normalized("NFC", text):
+        return text
+    return unicodedata.normalize("NFC", text)
+
+
+def _search_wrapper(text: str, pos: int = 0) -> Optional["re.Match[str]"]:
+    """Find the first wrapper at or after *pos*.
+
+    Equivalent to ``_WRAPPER_RE.search(text, pos)``, but candidates are located
+    with ``str.find`` on the ZWNBSP prefix (a vectorised C scan) and the regex
+    is only run anchored at each candidate.
+    """
+    find = text.find
+    match = _WRAPPER_RE.match
+    idx = find(ZWNBSP, pos)
+    while idx != -1:
+        m = match(text, idx)
+        if m:
+            return m
+        idx = find(ZWNBSP, idx + 1)
+    return None
 
 
 def encode_wrapper(manifest_bytes: bytes) -> str:
@@ -174,29 +183,24 @@ def embed_manifest(text: str, manifest_bytes: bytes) -> str:
     Returns:
         The NFC-normalized text with the wrapper appended.
     """
-    normalized_text = unicodedata.normalize("NFC", text)
+    normalized_text = _nfc(text)
     wrapper = encode_wrapper(manifest_bytes)
     return normalized_text + wrapper
 
 
-def find_wrapper_info(text: str) -> Optional[Tuple[bytes, int, int]]:
-    """
-    Locate and decode the C2PA wrapper in the text.
-
-    Args:
-        text: The text to search.
+def _locate_wrapper(text: str) -> Optional[Tuple[bytes, int, int]]:
+    """Locate and decode the wrapper, returning (manifest_bytes, start_char, end_char).
 
-    Returns:
-        Tuple(manifest_bytes, start_index, end_index) or None if not found/valid.
-        start_index and end_index allow extracting or excluding the wrapper.
+    Offsets are character indices into *text*, so callers that slice the string
+    need no UTF-8 encoding at all.
     """
     # Search for first wrapper
-    m = _WRAPPER_RE.search(text)
+    m = _search_wrapper(text)
     if not m:
         return None
 
     # Ensure there is no second wrapper occurrence (spec requirement)
-    second = _WRAPPER_RE.search(text, pos=m.end())
+    second = _search_wrapper(text, m.end())
     if second:
         raise ValueError("Multiple C2PA text wrappers detected – must embed exactly one per asset")
 
@@ -211,7 +215,7 @@ def find_wrapper_info(text: str) -> Optional[Tuple[bytes, int, int]]:
         # Too short
         return None
 
-    magic, version, length = _HEADER_STRUCT.unpack(raw[:_HEADER_SIZE])
+    magic, version, length = _HEADER_STRUCT.unpack_from(raw, 0)
 
     if magic != MAGIC:
         # Wrong magic
@@ -225,9 +229,27 @@ def find_wrapper_info(text: str) -> Optional[Tuple[bytes, int, int]]:
         # Truncated
         return None
 
-    manifest_bytes = raw[_HEADER_SIZE : _HEADER_SIZE + length]
-    wrapper_start_byte = len(text[: m.start()].encode("utf-8"))
-    wrapper_length_byte = len(text[m.start() : m.end()].encode("utf-8"))
+    return raw[_HEADER_SIZE : _HEADER_SIZE + length], m.start(), m.end()
+
+
+def find_wrapper_info(text: str) -> Optional[Tuple[bytes, int, int]]:
+    """
+    Locate and decode the C2PA wrapper in the text.
+
+    Args:
+        text: The text to search.
+
+    Returns:
+        Tuple(manifest_bytes, start_index, end_index) or None if not found/valid.
+        start_index and end_index allow extracting or excluding the wrapper.
+    """
+    loc = _locate_wrapper(text)
+    if loc is None:
+        return None
+
+    manifest_bytes, start_char, end_char = loc
+    wrapper_start_byte = len(text[:start_char].encode("utf-8"))
+    wrapper_length_byte = len(text[start_char:end_char].encode("utf-8"))
     return manifest_bytes, wrapper_start_byte, wrapper_length_byte
 
 
@@ -245,17 +267,14 @@ def extract_manifest(text: str) -> Tuple[Optional[bytes], str]:
         Tuple(manifest_bytes, clean_text).
         manifest_bytes is None if no valid wrapper is found.
     """
-    info = find_wrapper_info(text)
-    if not info:
-        return None, unicodedata.normalize("NFC", text)
-
-    manifest_bytes, wrapper_start_byte, wrapper_length_byte = info
-    wrapper_end_byte = wrapper_start_byte + wrapper_length_byte
-    start_char = _byte_offset_to_char_index(text, wrapper_start_byte)
-    end_char = _byte_offset_to_char_index(text, wrapper_end_byte)
+    loc = _locate_wrapper(text)
+    if loc is None:
+        return None, _nfc(text)
+
+    manifest_bytes, start_char, end_char = loc
     clean_text = text[:start_char] + text[end_char:]
 
-    return manifest_bytes, unicodedata.normalize("NFC", clean_text)
+    return manifest_bytes, _nfc(clean_text)
 
 
 __all__ = [
@@ -0,0 +1,14 @@
+"""
+Wrapper header constants shared by the codec and the validator.
+
+Kept in a leaf module so both can import them at module load without a
+circular import.
+"""
+
+import struct
+from typing import Final
+
+MAGIC: Final[bytes] = b"C2PATXT\0"  # 8-byte magic sequence (0x4332504154585400)
+VERSION: Final[int] = 1  # Current wrapper version
+_HEADER_STRUCT = struct.Struct("!8sBI")  # Big-endian: Magic(8), Version(1), Length(4)
+_HEADER_SIZE = _HEADER_STRUCT.size
@@ -15,12 +15,26 @@ Status codes follow the C2PA specification for text manifests.
 import struct
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from typing import Final, List, Optional
+
+from ._constants import _HEADER_SIZE, _HEADER_STRUCT, MAGIC, VERSION
 
 # JUMBF Constants (ISO/IEC 19566-5)
-JUMBF_SUPERBOX_TYPE = b"jumb"
-JUMBF_DESC_TYPE = b"jumd"
-C2PA_MANIFEST_STORE_UUID = bytes.fromhex("6332706100110010800000AA00389B71")  # c2pa UUID
+JUMBF_SUPERBOX_TYPE: Final[bytes] = b"jumb"
+JUMBF_DESC_TYPE: Final[bytes] = b"jumd"
+C2PA_MANIFEST_STORE_UUID: Final[bytes] = bytes.fromhex("6332706100110010800000AA00389B71")  # c2pa UUID
+
+_C2PA_MANIFEST_STORE_UUID_HEX = C2PA_MANIFEST_STORE_UUID.hex()
+_JUMBF_SUPERBOX_TYPE_U32 = int.from_bytes(JUMBF_SUPERBOX_TYPE, "big")
+_JUMBF_DESC_TYPE_U32 = int.from_bytes(JUMBF_DESC_TYPE, "big")
+
+# Precompiled box header decoders. On CPython, Struct.unpack_from on the
+# original buffer is several times faster than int.from_bytes over a memoryview
+# slice, despite the tuple it returns, so box headers are decoded through these.
+# Size and type are read in one call; the type is compared as an integer so no
+# 4-byte slice is allocated unless an error message needs it.
+_BOX_HEADER_STRUCT = struct.Struct(">II")  # Big-endian: Size(4), Type(4)
+_EXT_BOX_SIZE_STRUCT = struct.Struct(">Q")  # Big-endian 64-bit extended box size
 
 
 class ValidationCode(Enum):
@@ -92,128 +106,144 @@ class ValidationResult:
     def __str__(self) -> str:
         if self.valid:
             return "Validation passed: manifest is structurally compliant"
-        issues_str = "\n".join(f"  - [{i.code.value}] {i.message}" for i in self.issues)
+        issues_str = "\n".join([f"  - [{i.code.value}] {i.message}" for i in self.issues])
         return f"Validation failed:\n{issues_str}"
 
 
-def validate_jumbf_structure(jumbf_bytes: bytes, strict: bool = False) -> ValidationResult:
-    """
-    Validate basic JUMBF box structure.
-
-    This performs structural validation of the JUMBF container format,
-    checking box headers, sizes, and the presence of required elements.
+def _check_jumbf_structure(result: ValidationResult, jumbf_bytes: bytes, strict: bool) -> None:
+    """Run the JUMBF structural checks, recording any issues on *result*.
 
-    Args:
-        jumbf_bytes: Raw JUMBF bytes (the manifest store).
-        strict: If True, perform additional C2PA-specific checks.
-
-    Returns:
-        ValidationResult with detailed diagnostics.
+    Shared by the public validators so nested validation does not build and
+    merge an intermediate ValidationResult.
     """
-    result = ValidationResult(valid=True, jumbf_bytes=jumbf_bytes)
-
-    if not jumbf_bytes:
+    # Length gates run before any parsing so short input never reaches struct
+    data_len = len(jumbf_bytes)
+    if data_len == 0:
         result.add_issue(ValidationCode.EMPTY_MANIFEST, "JUMBF content is empty")
-        return result
+        return
 
     # Minimum JUMBF box: 8 bytes header (size + type)
-    if len(jumbf_bytes) < 8:
+    if data_len < 8:
         result.add_issue(
             ValidationCode.INVALID_JUMBF_HEADER,
-            f"JUMBF too short for box header: {len(jumbf_bytes)} bytes, minimum 8",
+            f"JUMBF too short for box header: {data_len} bytes, minimum 8",
             offset=0,
         )
-        return result
+        return
 
     # Parse first box header
     try:
-        box_size = struct.unpack(">I", jumbf_bytes[0:4])[0]
-        box_type = jumbf_bytes[4:8]
+        box_size, box_type = _BOX_HEADER_STRUCT.unpack_from(jumbf_bytes, 0)
     except struct.error as e:
         result.add_issue(
             ValidationCode.INVALID_JUMBF_HEADER,
             f"Failed to parse JUMBF box header: {e}",
             offset=0,
         )
-        return result
+        return
 
-    # Validate box size
-    if box_size == 0:
-        # Size 0 means "extends to end of file" - valid but we note it
+    # Validate box size; header_size tracks where the box content starts.
+    # Ordered by frequency so the usual 32-bit size takes a single compare.
+    header_size = 8
+    if box_size >= 8:
         pass
     elif box_size == 1:
         # Extended size (64-bit) - need 16 bytes minimum
-        if len(jumbf_bytes) < 16:
+        if data_len < 16:
             result.add_issue(
                 ValidationCode.TRUNCATED_JUMBF,
                 "Extended box size declared but not enough bytes for 64-bit size field",
                 offset=0,
             )
-            return result
-        box_size = struct.unpack(">Q", jumbf_bytes[8:16])[0]
-    elif box_size < 8:
+            return
+        box_size = _EXT_BOX_SIZE_STRUCT.unpack_from(jumbf_bytes, 8)[0]
+        header_size = 16
+    elif box_size == 0:
+        # Size 0 means "extends to end of file", so the box is exactly the data
+        box_size = data_len
+    else:
         result.add_issue(
             ValidationCode.INVALID_JUMBF_BOX_SIZE,
             f"Invalid box size: {box_size} (minimum is 8)",
             offset=0,
         )
-        return result
+        return
 
     # Check if we have enough bytes
-    if box_size > 0 and len(jumbf_bytes) < box_size:
+    if data_len < box_size:
         result.add_issue(
             ValidationCode.TRUNCATED_JUMBF,
-            f"JUMBF truncated: declared size {box_size}, actual {len(jumbf_bytes)}",
+            f"JUMBF truncated: declared size {box_size}, actual {data_len}",
             offset=0,
         )
-        return result
+        return
 
     # Check for JUMBF superbox type
-    if box_type != JUMBF_SUPERBOX_TYPE:
+    if box_type != _JUMBF_SUPERBOX_TYPE_U32:
+        box_type = bytes(jumbf_bytes[4:8])
         result.add_issue(
             ValidationCode.INVALID_JUMBF_HEADER,
             f"Expected JUMBF superbox type 'jumb', got '{box_type!r}'",
             offset=4,
             context=f"box_type={box_type.hex()}",
         )
-        return result
+        return
 
     if strict:
         # Check for description box (jumd) which should follow immediately
         # after the superbox header
-        header_size = 8 if box_size != 1 else 16
-        if len(jumbf_bytes) < header_size + 8:
+        if data_len < header_size + 8:
             result.add_issue(
                 ValidationCode.MISSING_DESCRIPTION_BOX,
                 "JUMBF superbox too short to contain description box",
                 offset=header_size,
             )
-            return result
+            return
 
-        _desc_size = struct.unpack(">I", jumbf_bytes[header_size : header_size + 4])[0]  # noqa: F841
-        desc_type = jumbf_bytes[header_size + 4 : header_size + 8]
+        _desc_size, desc_type = _BOX_HEADER_STRUCT.unpack_from(jumbf_bytes, header_size)
 
-        if desc_type != JUMBF_DESC_TYPE:
+        if desc_type != _JUMBF_DESC_TYPE_U32:
+            desc_type = bytes(jumbf_bytes[header_size + 4 : header_size + 8])
             result.add_issue(
                 ValidationCode.MISSING_DESCRIPTION_BOX,
                 f"Expected description box 'jumd', got '{desc_type!r}'",
                 offset=header_size + 4,
             )
-            return result
+            return
 
         # Check for C2PA UUID in description box
         # UUID is at offset 8 within the description box content
         uuid_offset = header_size + 8  # After desc box header
-        if len(jumbf_bytes) >= uuid_offset + 16:
+        # A 16-byte slice compared to the module constant is faster in CPython
+        # than unpacking two 64-bit halves and comparing integers.
+        if data_len >= uuid_offset + 16:
             found_uuid = jumbf_bytes[uuid_offset : uuid_offset + 16]
             if found_uuid != C2PA_MANIFEST_STORE_UUID:
                 result.add_issue(
                     ValidationCode.INVALID_C2PA_UUID,
                     "Invalid C2PA manifest store UUID",
                     offset=uuid_offset,
-                    context=f"expected={C2PA_MANIFEST_STORE_UUID.hex()}, found={found_uuid.hex()}",
+                    context=f"expected={_C2PA_MANIFEST_STORE_UUID_HEX}, found={found_uuid.hex()}",
                 )
 
+
+def validate_jumbf_structure(jumbf_bytes: bytes, strict: bool = False) -> ValidationResult:
+    """
+    Validate basic JUMBF box structure.
+
+    This performs structural validation of the JUMBF container format,
+    checking box headers, sizes, and the presence of required elements.
+
+    Args:
+        jumbf_bytes: Raw JUMBF bytes (the manifest store). Any bytes-like
+            object (bytes, bytearray, memoryview) is accepted without copying.
+        strict: If True, perform additional C2PA-specific checks.
+
+    Returns:
+        ValidationResult with detailed diagnostics.
+    """
+    result = ValidationResult(valid=True, jumbf_bytes=jumbf_bytes)
+    _check_jumbf_structure(result, jumbf_bytes, strict)
     return result
 
 
@@ -229,7 +259,8 @@ def validate_manifest(
     bytes represent a valid structure that can be embedded using c2pa-text.
 
     Args:
-        manifest_bytes: The raw manifest bytes to validate.
+        manifest_bytes: The raw manifest bytes to validate. Any bytes-like
+            object is accepted without copying.
         validate_jumbf: If True, also validate JUMBF structure.
         strict: If True, perform additional C2PA-specific checks.
 
@@ -255,10 +286,7 @@ def validate_manifest(
 
     # If validate_jumbf is enabled, validate the JUMBF structure
     if validate_jumbf:
-        jumbf_result = validate_jumbf_structure(manifest_bytes, strict=strict)
-        if not jumbf_result.valid:
-            result.issues.extend(jumbf_result.issues)
-            result.valid = False
+        _check_jumbf_structure(result, manifest_bytes, strict)
 
     return result
 
@@ -271,27 +299,27 @@ def validate_wrapper_bytes(wrapper_bytes: bytes) -> ValidationResult:
     (e.g., extracted from text and decoded from variation selectors).
 
     Args:
-        wrapper_bytes: The decoded wrapper bytes (header + JUMBF).
+        wrapper_bytes: The decoded wrapper bytes (header + JUMBF). Any
+            bytes-like object is accepted.
 
     Returns:
         ValidationResult with detailed diagnostics.
     """
-    from . import _HEADER_SIZE, _HEADER_STRUCT, MAGIC, VERSION
-
     result = ValidationResult(valid=True)
 
     # Check minimum length
-    if len(wrapper_bytes) < _HEADER_SIZE:
+    wrapper_len = len(wrapper_bytes)
+    if wrapper_len < _HEADER_SIZE:
         result.add_issue(
             ValidationCode.CORRUPTED_WRAPPER,
-            f"Wrapper too short: {len(wrapper_bytes)} bytes, minimum {_HEADER_SIZE}",
+            f"Wrapper too short: {wrapper_len} bytes, minimum {_HEADER_SIZE}",
             offset=0,
         )
         return result
 
     # Parse header
     try:
-        magic, version, length = _HEADER_STRUCT.unpack(wrapper_bytes[:_HEADER_SIZE])
+        magic, version, length = _HEADER_STRUCT.unpack_from(wrapper_bytes, 0)
     except struct.error as e:
         result.add_issue(
             ValidationCode.CORRUPTED_WRAPPER,
@@ -302,7 +330,8 @@ def validate_wrapper_bytes(wrapper_bytes: bytes) -> ValidationResult:
 
     result.version = version
     result.declared_length = length
-    result.actual_length = len(wrapper_bytes) - _HEADER_SIZE
+    actual_jumbf_length = wrapper_len - _HEADER_SIZE
+    result.actual_length = actual_jumbf_length
 
     # Validate magic
     if magic != MAGIC:
@@ -324,7 +353,6 @@ def validate_wrapper_bytes(wrapper_bytes: bytes) -> ValidationResult:
         return result
 
     # Validate length
-    actual_jumbf_length = len(wrapper_bytes) - _HEADER_SIZE
     if length != actual_jumbf_length:
         result.add_issue(
             ValidationCode.LENGTH_MISMATCH,
@@ -334,14 +362,12 @@ def validate_wrapper_bytes(wrapper_bytes: bytes) -> ValidationResult:
         return result
 
     # Extract and validate JUMBF
-    jumbf_bytes = wrapper_bytes[_HEADER_SIZE:]
+    # Slice through a memoryview so bytearray/memoryview input is copied only once
+    jumbf_bytes = bytes(memoryview(wrapper_bytes)[_HEADER_SIZE:])
     result.jumbf_bytes = jumbf_bytes
     result.manifest_bytes = jumbf_bytes
 
-    jumbf_result = validate_jumbf_structure(jumbf_bytes)
-    if not jumbf_result.valid:
-        result.issues.extend(jumbf_result.issues)
-        result.valid = False
+    _check_jumbf_structure(result, jumbf_bytes, False)
 
     return result
 
@@ -76,6 +76,17 @@ class TestValidateManifest:
         assert not result.valid
         assert result.primary_code == ValidationCode.TRUNCATED_JUMBF
 
+    def test_accepts_bytes_like_input(self):
+        """bytearray and memoryview inputs should validate like bytes."""
+        jumbf = struct.pack(">I", 8) + b"jumb"
+        assert validate_manifest(bytearray(jumbf)).valid
+        assert validate_manifest(memoryview(jumbf)).valid
+
+        invalid = memoryview(struct.pack(">I", 8) + b"xxxx")
+        result = validate_manifest(invalid)
+        assert result.primary_code == ValidationCode.INVALID_JUMBF_HEADER
+        assert "b'xxxx'" in str(result)
+
 
 class TestValidateJumbfStructure:
     """Tests for validate_jumbf_structure() with strict mode."""
@@ -107,6 +118,15 @@ class TestValidateJumbfStructure:
         result = validate_jumbf_structure(jumbf, strict=True)
         assert result.valid
 
+    def test_strict_with_extended_size_superbox(self):
+        """Strict mode should find the description box after a 16-byte extended header."""
+        c2pa_uuid = bytes.fromhex("6332706100110010800000AA00389B71")
+        desc_content = c2pa_uuid + b"\x00" * 8
+        desc_box = struct.pack(">I", 8 + len(desc_content)) + b"jumd" + desc_content
+        jumbf = struct.pack(">I", 1) + b"jumb" + struct.pack(">Q", 16 + len(desc_box)) + desc_box
+        result = validate_jumbf_structure(jumbf, strict=True)
+        assert result.valid
+
 
 class TestValidateWrapperBytes:
     """Tests for validate_wrapper_bytes() - validates pre-encoded wrappers."""
@@ -121,6 +141,15 @@ class TestValidateWrapperBytes:
         assert result.version == VERSION
         assert result.declared_length == len(jumbf)
 
+    def test_valid_wrapper_memoryview(self):
+        """A memoryview over a wrapper should validate and yield bytes for the JUMBF."""
+        jumbf = struct.pack(">I", 8) + b"jumb"
+        header = struct.pack("!8sBI", MAGIC, VERSION, len(jumbf))
+        result = validate_wrapper_bytes(memoryview(header + jumbf))
+        assert result.valid
+        assert result.jumbf_bytes == jumbf
+        assert isinstance(result.jumbf_bytes, bytes)
+
     def test_wrapper_too_short(self):
         """Wrapper shorter than header size should fail."""
         result = validate_wrapper_bytes(b"short")
@@ -179,6 +208,20 @@ class TestValidationResult:
         result.add_issue(ValidationCode.EMPTY_MANIFEST, "Test")
         assert not result.valid
 
+    def test_successful_results_are_independent(self):
+        """Each successful validation returns its own result carrying its input."""
+        first = struct.pack(">I", 8) + b"jumb"
+        second = struct.pack(">I", 16) + b"jumb" + b"\x00" * 8
+        result_a = validate_manifest(first)
+        result_b = validate_manifest(second)
+        assert result_a is not result_b
+        assert result_a.manifest_bytes == first
+        assert result_b.manifest_bytes == second
+
+        result_a.add_issue(ValidationCode.EMPTY_MANIFEST, "Mutated")
+        assert result_b.valid
+        assert validate_manifest(first).valid
+
 
 class TestIntegration:
     """Integration tests combining validation with embed/extract."""
@@ -236,3 +279,13 @@ class TestWrapperOffsets:
         extracted2, clean = extract_manifest(embedded)
         assert extracted2 == jumbf
         assert clean == normalized_nfc
+
+    def test_stray_zwnbsp_before_wrapper_is_skipped(self):
+        jumbf = struct.pack(">I", 8) + b"jumb"
+        text = "\ufeffBOM-prefixed \ufeff text"
+        embedded = embed_manifest(text, jumbf)
+
+        info = find_wrapper_info(embedded)
+        assert info is not None
+        assert info[0] == jumbf
+        assert info[1] == len(text.encode("utf-8"))